@@ -7,13 +7,17 @@
 import os
 import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import ExitStack
+from email.message import Message
 from hashlib import sha1
+from http.client import HTTPResponse
 from pathlib import Path
 from shutil import rmtree
 from tarfile import TarFile, is_tarfile
 from tempfile import NamedTemporaryFile
-from typing import Dict, Iterator, Optional, final
+from threading import Event, Lock
+from typing import IO, Dict, Final, Iterator, Optional, final
 from urllib.error import HTTPError, URLError
 from urllib.parse import unquote, urlparse
 from urllib.request import Request, urlopen
@@ -22,7 +26,11 @@ from zipfile import BadZipFile, ZipFile
 from tqdm import tqdm  # type: ignore[import]
 
 from fairseq2.assets.error import AssetError
-from fairseq2.assets.utils import _get_path_from_env, _starts_with_scheme
+from fairseq2.assets.utils import (
+    _get_int_from_env,
+    _get_path_from_env,
+    _starts_with_scheme,
+)
 from fairseq2.typing import finaloverride
 
 
@@ -122,6 +130,7 @@ class InProcAssetDownloadManager(AssetDownloadManager):
     """Downloads assets in this process."""
 
     cache_dir: Path
+    num_streams: int
 
     def __init__(self) -> None:
         cache_dir = _get_path_from_env("FAIRSEQ2_CACHE_DIR", missing_ok=True)
@@ -134,6 +143,18 @@ class InProcAssetDownloadManager(AssetDownloadManager):
 
         self.cache_dir = cache_dir
 
+        # The number of concurrent HTTP range requests to use to download large
+        # assets from servers that support them.
+        num_streams = _get_int_from_env("FAIRSEQ2_DOWNLOAD_STREAMS")
+        if num_streams is None:
+            num_streams = 1
+        elif num_streams < 1:
+            raise RuntimeError(
+                f"The value of the `FAIRSEQ2_DOWNLOAD_STREAMS` environment variable must be greater than or equal to 1, but is {num_streams} instead."
+            )
+
+        self.num_streams = num_streams
+
     @finaloverride
     def download_checkpoint(
         self,
@@ -151,7 +172,14 @@ class InProcAssetDownloadManager(AssetDownloadManager):
             display_name = f"{display_name} (shard {shard_idx})"
 
         op = _AssetDownloadOp(
-            self.cache_dir, uri, display_name, force, cache_only, progress, shard_idx
+            self.cache_dir,
+            uri,
+            display_name,
+            force,
+            cache_only,
+            progress,
+            self.num_streams,
+            shard_idx,
         )
 
         return op.run()
@@ -173,7 +201,13 @@ class InProcAssetDownloadManager(AssetDownloadManager):
             display_name = f"{tokenizer_name} tokenizer of {model_name}"
 
         op = _AssetDownloadOp(
-            self.cache_dir, uri, display_name, force, cache_only, progress
+            self.cache_dir,
+            uri,
+            display_name,
+            force,
+            cache_only,
+            progress,
+            self.num_streams,
         )
 
         return op.run()
@@ -191,7 +225,13 @@ class InProcAssetDownloadManager(AssetDownloadManager):
         display_name = f"{dataset_name} dataset"
 
         op = _AssetDownloadOp(
-            self.cache_dir, uri, display_name, force, cache_only, progress
+            self.cache_dir,
+            uri,
+            display_name,
+            force,
+            cache_only,
+            progress,
+            self.num_streams,
         )
 
         return op.run()
@@ -206,6 +246,7 @@ class _AssetDownloadOp:
     force: bool
     cache_only: bool
     progress: bool
+    num_streams: int
     shard_idx: Optional[int]
 
     def __init__(
@@ -216,6 +257,7 @@ class _AssetDownloadOp:
         force: bool,
         cache_only: bool,
         progress: bool,
+        num_streams: int = 1,
         shard_idx: Optional[int] = None,
     ) -> None:
         self.cache_dir = cache_dir
@@ -226,6 +268,7 @@ class _AssetDownloadOp:
         self.force = force
         self.cache_only = cache_only
         self.progress = progress
+        self.num_streams = num_streams
         self.shard_idx = shard_idx
 
     def run(self) -> Path:
@@ -410,14 +453,7 @@ class _AssetDownloadOp:
             if self.progress:
                 self._print_progress(f"Downloading the {self.display_name}...")
 
-            request = Request(
-                self.uri,
-                # Most hosting providers return 403 if the user-agent is not a
-                # well-known string. Act like Firefox.
-                headers={
-                    "User-Agent": "Mozilla/5.0 (X11; Linux i686; rv:109.0) Gecko/20100101 Firefox/119.0"
-                },
-            )
+            request = Request(self.uri, headers=_HTTP_HEADERS)
 
             try:
                 response = cleanup_stack.enter_context(urlopen(request))
@@ -441,8 +477,6 @@ class _AssetDownloadOp:
                 NamedTemporaryFile(delete=False, dir=tmp_dir)
             )
 
-            num_bytes_read = 0
-
             progress_bar = cleanup_stack.enter_context(
                 tqdm(
                     total=size,
@@ -453,33 +487,19 @@ class _AssetDownloadOp:
                 )
             )
 
-            while True:
-                try:
-                    buffer = response.read(1024 * 8)
-                except HTTPError as ex:
-                    raise AssetDownloadError(
-                        f"The download of the {self.display_name} has failed with the HTTP error code {ex.code}."
-                    )
-
-                buffer_len = len(buffer)
-                if buffer_len == 0:
-                    break
-
-                if size is not None:
-                    num_bytes_read += buffer_len
-                    if num_bytes_read > size:
-                        raise AssetDownloadError(
-                            f"The download of the {self.display_name} has failed. The number of bytes sent by the server exceeded the expected size of {size:,} bytes."
-                        )
-
-                fp.write(buffer)
+            num_parts = self._get_num_parts(headers, size)
+            if num_parts > 1:
+                assert size is not None
 
-                progress_bar.update(buffer_len)
+                # The asset will be downloaded with range requests; no need to
+                # keep the initial connection open.
+                response.close()
 
-            if size is not None and num_bytes_read < size:
-                raise AssetDownloadError(
-                    f"The download of the {self.display_name} has failed. The server sent {num_bytes_read:,} bytes which is less than the expected size of {size:,} bytes."
+                self._download_ranges(
+                    response.geturl(), fp, size, num_parts, progress_bar
                 )
+            else:
+                self._download_stream(response, fp, size, progress_bar)
 
             fp.close()
 
@@ -506,6 +526,159 @@ class _AssetDownloadOp:
 
             succeeded = True
 
+    def _download_stream(
+        self,
+        response: HTTPResponse,
+        fp: IO[bytes],
+        size: Optional[int],
+        progress_bar: tqdm,
+    ) -> None:
+        num_bytes_read = 0
+
+        while True:
+            try:
+                buffer = response.read(1024 * 8)
+            except HTTPError as ex:
+                raise AssetDownloadError(
+                    f"The download of the {self.display_name} has failed with the HTTP error code {ex.code}."
+                )
+
+            buffer_len = len(buffer)
+            if buffer_len == 0:
+                break
+
+            if size is not None:
+                num_bytes_read += buffer_len
+                if num_bytes_read > size:
+                    raise AssetDownloadError(
+                        f"The download of the {self.display_name} has failed. The number of bytes sent by the server exceeded the expected size of {size:,} bytes."
+                    )
+
+            fp.write(buffer)
+
+            progress_bar.update(buffer_len)
+
+        if size is not None and num_bytes_read < size:
+            raise AssetDownloadError(
+                f"The download of the {self.display_name} has failed. The server sent {num_bytes_read:,} bytes which is less than the expected size of {size:,} bytes."
+            )
+
+    def _get_num_parts(self, headers: Message, size: Optional[int]) -> int:
+        if self.num_streams == 1 or size is None or not hasattr(os, "pwrite"):
+            return 1
+
+        if headers.get("Accept-Ranges", "none").strip().lower() != "bytes":
+            return 1
+
+        # Do not split the asset into parts smaller than `_MIN_PART_SIZE`.
+        return min(self.num_streams, -(-size // _MIN_PART_SIZE))
+
+    def _download_ranges(
+        self,
+        url: str,
+        fp: IO[bytes],
+        size: int,
+        num_parts: int,
+        progress_bar: tqdm,
+    ) -> None:
+        fd = fp.fileno()
+
+        # Preallocate the file so that the parts can be written in place.
+        try:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(fd, 0, size)
+            else:
+                os.ftruncate(fd, size)
+        except OSError as ex:
+            raise AssetDownloadError(
+                f"The space for the {self.display_name} cannot be allocated in the asset download directory. See nested exception for details."
+            ) from ex
+
+        part_size = -(-size // num_parts)
+
+        failed = Event()
+
+        # `tqdm` is not thread-safe.
+        progress_lock = Lock()
+
+        def download_range(begin: int, end: int) -> None:
+            headers = {**_HTTP_HEADERS, "Range": f"bytes={begin}-{end - 1}"}
+
+            request = Request(url, headers=headers)
+
+            try:
+                response = urlopen(request)
+            except HTTPError as ex:
+                raise AssetDownloadError(
+                    f"The download of the {self.display_name} has failed with the HTTP error code {ex.code}."
+                )
+            except URLError as ex:
+                raise AssetDownloadError(
+                    f"The download of the {self.display_name} has failed. See nested exception for details."
+                ) from ex
+
+            with response:
+                # If the server ignores the range, it returns the whole asset.
+                if response.status != 206:
+                    raise AssetDownloadError(
+                        f"The download of the {self.display_name} has failed. The server does not honor range requests."
+                    )
+
+                offset = begin
+
+                while offset < end and not failed.is_set():
+                    try:
+                        buffer = response.read(min(_RANGE_BUFFER_SIZE, end - offset))
+                    except HTTPError as ex:
+                        raise AssetDownloadError(
+                            f"The download of the {self.display_name} has failed with the HTTP error code {ex.code}."
+                        )
+
+                    buffer_len = len(buffer)
+                    if buffer_len == 0:
+                        raise AssetDownloadError(
+                            f"The download of the {self.display_name} has failed. The server sent {offset - begin:,} bytes which is less than the expected size of {end - begin:,} bytes for the range starting at byte {begin:,}."
+                        )
+
+                    try:
+                        os.pwrite(fd, buffer, offset)
+                    except OSError as ex:
+                        raise AssetDownloadError(
+                            f"The {self.display_name} cannot be written to the asset download directory. See nested exception for details."
+                        ) from ex
+
+                    offset += buffer_len
+
+                    with progress_lock:
+                        progress_bar.update(buffer_len)
+
+        def safe_download_range(begin: int, end: int) -> None:
+            try:
+                download_range(begin, end)
+            except BaseException:
+                # Signal the remaining streams to stop early.
+                failed.set()
+
+                raise
+
+        ranges = [(b, min(b + part_size, size)) for b in range(0, size, part_size)]
+
+        with ThreadPoolExecutor(max_workers=num_parts) as executor:
+            futures = [executor.submit(safe_download_range, b, e) for b, e in ranges]
+
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                # If we are interrupted (e.g. Ctrl-C), do not let the executor
+                # wait for the remaining parts to be downloaded in full.
+                failed.set()
+
+                for future in futures:
+                    future.cancel()
+
+                raise
+
     def _ensure_asset_extracted(self) -> None:
         if self.cache_only:
             return
@@ -651,6 +824,17 @@ class _AssetDownloadOp:
         print(s, file=sys.stderr)
 
 
+# Most hosting providers return 403 if the user-agent is not a well-known string.
+# Act like Firefox.
+_HTTP_HEADERS: Final = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux i686; rv:109.0) Gecko/20100101 Firefox/119.0"
+}
+
+_MIN_PART_SIZE: Final = 16 * 1024 * 1024
+
+_RANGE_BUFFER_SIZE: Final = 1024 * 1024
+
+
 class AssetDownloadError(AssetError):
     """Raised when an asset download operation fails."""
 
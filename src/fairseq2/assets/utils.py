@@ -42,3 +42,16 @@ def _get_path_from_env(var_name: str, missing_ok: bool = False) -> Optional[Path
         return None
 
     return resolved_path
+
+
+def _get_int_from_env(var_name: str) -> Optional[int]:
+    s = os.getenv(var_name)
+    if not s:
+        return None
+
+    try:
+        return int(s)
+    except ValueError as ex:
+        raise RuntimeError(
+            f"The value of the `{var_name}` environment variable must be an integer, but is '{s}' instead."
+        ) from ex
@@ -363,9 +363,9 @@ class BeamSearchAlgorithm(ABC):
         :param beam_size:
             The beam size.
         :param lprobs:
-            The next-step log probability of each vocabulary entry. *Shape:*
-            :math:`(N,V)`, where :math:`N` is the batch size and :math:`V` is
-            the size of the vocabulary.
+            The next-step log probability of each vocabulary entry. Can be
+            modified in-place. *Shape:* :math:`(N,V)`, where :math:`N` is the
+            batch size and :math:`V` is the size of the vocabulary.
         :param step_scores:
             The cumulative score of each step in the beam. *Shape:* :math:`(N,S)`,
             where :math:`N` is the batch size and :math:`S` is the length of the
@@ -428,8 +428,10 @@ class StandardBeamSearchAlgorithm(BeamSearchAlgorithm):
         vocab_size = lprobs.size(1)
 
         # Make the probabilities contain cumulative scores for each hypothesis.
+        # `lprobs` is not used by the caller after this call, so we can update
+        # it in-place instead of allocating another (N, V) tensor.
         # (N, V) + (N, 1) = (N, V)
-        lprobs = lprobs + step_scores[:, -1].unsqueeze(-1)
+        lprobs.add_(step_scores[:, -1].unsqueeze(-1))
 
         # (N, V) -> (N x V)
         lprobs = lprobs.view(-1)
@@ -690,7 +692,7 @@ class _BeamSearchSequenceGeneratorOpBase(ABC):
                 processor(self.seqs[:, : self.step_nr], lprobs, lprob=True)
 
             # Apply UNK penalty.
-            if self.unk_idx is not None:
+            if self.unk_idx is not None and self.unk_penalty != 0.0:
                 lprobs[:, self.unk_idx] -= self.unk_penalty
 
             # Never allow PAD.
@@ -701,6 +703,20 @@ class _BeamSearchSequenceGeneratorOpBase(ABC):
             if self.step_nr < self.min_seq_len - 1:
                 lprobs[:, self.eos_idx] = -torch.inf
 
+        prompt_step_mask: Optional[List[bool]]
+
+        if self.step_nr < self.max_prompt_len:
+            assert self.prompt_mask is not None
+
+            # Fetch the prompt mask of the current step in a single transfer
+            # instead of synchronizing with the device for each beam.
+            # (N)
+            prompt_step_mask = self.prompt_mask[:, self.step_nr].tolist()
+        else:
+            self.prompt_mask = None  # Not needed anymore, release.
+
+            prompt_step_mask = None
+
         batch_offset = 0
 
         new_beam_sizes: List[int] = []
@@ -711,8 +727,14 @@ class _BeamSearchSequenceGeneratorOpBase(ABC):
         for beam_idx, (beam_lprobs, beam_step_scores) in enumerate(
             zip(lprobs.split(self.beam_sizes), self.step_scores.split(self.beam_sizes))
         ):
+            # Check if the current beam is in a prompt sequence.
+            if prompt_step_mask is None:
+                in_prompt = False
+            else:
+                in_prompt = prompt_step_mask[batch_offset]
+
             beam_next_step = self._search_beam(
-                beam_idx, batch_offset, beam_lprobs, beam_step_scores
+                beam_idx, batch_offset, beam_lprobs, beam_step_scores, in_prompt
             )
 
             # Bump the beam batch offset to the next beam.
@@ -759,29 +781,28 @@ class _BeamSearchSequenceGeneratorOpBase(ABC):
         return True
 
     def _search_beam(
-        self, beam_idx: int, batch_offset: int, lprobs: Tensor, step_scores: Tensor
+        self,
+        beam_idx: int,
+        batch_offset: int,
+        lprobs: Tensor,
+        step_scores: Tensor,
+        in_prompt: bool,
     ) -> Optional[BeamStep]:
         # Ignore the generated indices for the prompt sequences.
-        if self.step_nr < self.max_prompt_len:
-            assert self.prompt_mask is not None
-
-            # Check if the current beam is in a prompt sequence.
-            if self.prompt_mask[batch_offset, self.step_nr]:
-                # The size of a beam in a prompt sequence must be always 1.
-                assert len(lprobs) == 1
+        if in_prompt:
+            # The size of a beam in a prompt sequence must be always 1.
+            assert len(lprobs) == 1
 
-                seq_index = torch.tensor([batch_offset], device=lprobs.device)
+            seq_index = torch.tensor([batch_offset], device=lprobs.device)
 
-                # We just extract the prompt step along with its score and treat
-                # it as the next beam step. So we keep a beam of size 1 until we
-                # reach the end of the prompt.
-                vocab_index = self.seqs[batch_offset, self.step_nr : self.step_nr + 1]
+            # We just extract the prompt step along with its score and treat it
+            # as the next beam step. So we keep a beam of size 1 until we reach
+            # the end of the prompt.
+            vocab_index = self.seqs[batch_offset, self.step_nr : self.step_nr + 1]
 
-                score = step_scores[0, self.step_nr - 1] + lprobs[0, vocab_index]
+            score = step_scores[0, self.step_nr - 1] + lprobs[0, vocab_index]
 
-                return BeamStep(seq_index, vocab_index, score)
-        else:
-            self.prompt_mask = None  # Not needed anymore, release.
+            return BeamStep(seq_index, vocab_index, score)
 
         # We use the same beam search method as in fairseq, where we take the
         # best 2 x `beam_size` candidates and choose the first `beam_size` of
@@ -954,6 +975,7 @@ class _BeamSearchSeq2SeqGeneratorOp(_BeamSearchSequenceGeneratorOpBase):
     model: EncoderDecoderModel
     encoder_output: Tensor
     encoder_padding_mask: Optional[PaddingMask]
+    encoder_beam_sizes: List[int]
 
     def __init__(
         self,
@@ -1001,6 +1023,9 @@ class _BeamSearchSeq2SeqGeneratorOp(_BeamSearchSequenceGeneratorOpBase):
         self.encoder_output = encoder_output
         self.encoder_padding_mask = encoder_padding_mask
 
+        # Holds the beam sizes that `encoder_output` is laid out for.
+        self.encoder_beam_sizes = list(self.beam_sizes)
+
     @override
     def _decode(self, seqs: Tensor) -> SequenceModelOutput:
         decoder_output, decoder_padding_mask = self.model.decode(
@@ -1017,6 +1042,15 @@ class _BeamSearchSeq2SeqGeneratorOp(_BeamSearchSequenceGeneratorOpBase):
     def _reorder_state(self, new_order: Tensor) -> None:
         super()._reorder_state(new_order)
 
+        # All sequences of a beam share the encoder output of their prompt, and
+        # `new_order` never moves a sequence across beams. As long as the sizes
+        # of the beams do not change, reordering would produce the very same
+        # tensor; skip the copy.
+        if self.beam_sizes == self.encoder_beam_sizes:
+            return
+
+        self.encoder_beam_sizes = list(self.beam_sizes)
+
         self.encoder_output = self.encoder_output.index_select(dim=0, index=new_order)
 
         if self.encoder_padding_mask is not None:
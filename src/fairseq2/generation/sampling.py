@@ -721,7 +721,7 @@ class _SamplingSequenceGeneratorOpBase(ABC):
                 processor(self.seqs[:, : self.step_nr], probs)
 
             # Apply UNK penalty.
-            if self.unk_idx is not None:
+            if self.unk_idx is not None and self.unk_penalty != 0.0:
                 probs[:, self.unk_idx] -= self.unk_penalty
 
             # Never allow PAD.
@@ -4,12 +4,19 @@
 # This source code is licensed under the BSD-style license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Optional, Sequence, Set, final
+from typing import Final, Optional, Sequence, Set, Tuple, final
 
 from fairseq2.data.text import SentencePieceEncoder, SentencePieceTokenizerBase
 from fairseq2.data.typing import PathLike
 from fairseq2.typing import Device, finaloverride
 
+# Internal control symbols that are not relevant for eval use.
+_INTERNAL_CONTROL_SYMBOLS: Final[Tuple[str, ...]] = (
+    "<MINED_DATA>",
+    "<MMT_BT_DATA>",
+    "<SMT_BT_DATA>",
+)
+
 
 @final
 class NllbTokenizer(SentencePieceTokenizerBase):
@@ -32,8 +39,7 @@ class NllbTokenizer(SentencePieceTokenizerBase):
         # Each language is represented by a `__lang__` control symbol.
         control_symbols = [f"__{lang}__" for lang in langs]
 
-        # Internal control symbols that are not relevant for eval use.
-        control_symbols.extend(["<MINED_DATA>", "<MMT_BT_DATA>", "<SMT_BT_DATA>"])
+        control_symbols.extend(_INTERNAL_CONTROL_SYMBOLS)
 
         # The SentencePiece model of NLLB is peculiar as it does not define a
         # PAD symbol. We use an undocumented feature of our C++ API to insert
@@ -137,7 +137,10 @@ class TransformerEmbeddingFrontend(TransformerFrontend):
             self.register_module("layer_norm", None)
 
         if dropout_p > 0.0:
-            self.dropout = Dropout(dropout_p)
+            # Layer Normalization always returns a new tensor that is not needed
+            # for its backward pass, so we can apply dropout to it in-place and
+            # avoid another activation-sized allocation.
+            self.dropout = Dropout(dropout_p, inplace=layer_norm)
         else:
             self.register_module("dropout", None)
 
@@ -152,7 +155,9 @@ class TransformerEmbeddingFrontend(TransformerFrontend):
         embeds = self.embed(seqs)
 
         if self.scale != 1.0:
-            embeds = embeds * self.scale
+            # The embedding lookup always returns a new tensor, so we can scale
+            # it in-place instead of allocating another activation-sized one.
+            embeds.mul_(self.scale)
 
         if self.pos_encoder is not None:
             embeds = self.pos_encoder(embeds, padding_mask, state_bag=state_bag)
@@ -91,18 +91,25 @@ def convert_model_state_dict(
     """
     new_state_dict = {}
 
+    # Compile the patterns once instead of looking them up in the regex cache
+    # for every key.
+    compiled_key_map = [
+        (re.compile(old_pattern), replacement)
+        for old_pattern, replacement in key_map.items()
+    ]
+
     def get_new_key(old_key: str) -> str:
-        for old_pattern, replacement in key_map.items():
-            if (new_key := re.sub(old_pattern, replacement, old_key)) != old_key:
+        for old_pattern, replacement in compiled_key_map:
+            if (new_key := old_pattern.sub(replacement, old_key)) != old_key:
                 return new_key
 
         return old_key
 
     # Convert module keys from fairseq to fairseq2.
-    for old_key in state_dict.keys():
+    for old_key, value in state_dict.items():
         new_key = get_new_key(old_key)
 
-        new_state_dict[new_key] = state_dict[old_key]
+        new_state_dict[new_key] = value
 
     return new_state_dict
 
@@ -5,13 +5,27 @@
 # LICENSE file in the root directory of this source tree.
 
 import logging
+import os
 from abc import ABC, abstractmethod
 from copy import deepcopy
 from functools import partial
 from pathlib import Path
 from pickle import PickleError
-from typing import Any, Dict, Generic, Optional, Protocol, TypeVar, Union, final
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    TypeVar,
+    Union,
+    final,
+)
 
+import torch
+from torch import Tensor
 from torch.nn import Module
 
 from fairseq2.assets import (
@@ -33,6 +47,7 @@ from fairseq2.nn.utils.module import (
 )
 from fairseq2.typing import CPU, META, DataType, Device, finaloverride
 from fairseq2.utils.dataclass import update_dataclass
+from fairseq2.utils.version import _is_pt21_or_greater
 
 logger = logging.getLogger("fairseq2.models")
 
@@ -156,6 +171,7 @@ class ModelLoader(Generic[ModelT, ConfigT]):
     model_factory: ModelFactory[ConfigT, ModelT]
     checkpoint_converter: Optional[CheckpointConverter[ConfigT]]
     restrict_checkpoints: bool
+    drop_checkpoint_cache: bool
 
     def __init__(
         self,
@@ -165,6 +181,7 @@ class ModelLoader(Generic[ModelT, ConfigT]):
         model_factory: ModelFactory[ConfigT, ModelT],
         checkpoint_converter: Optional[CheckpointConverter[ConfigT]] = None,
         restrict_checkpoints: bool = True,
+        drop_checkpoint_cache: bool = False,
     ) -> None:
         """
         :param asset_store:
@@ -181,6 +198,10 @@ class ModelLoader(Generic[ModelT, ConfigT]):
         :param restrict_checkpoints:
             If ``True``, restricts the Python unpickler to load only tensors,
             primitive types, and dictionaries.
+        :param drop_checkpoint_cache:
+            If ``True``, advises the kernel to evict the checkpoint from the
+            page cache once the model is loaded. Should not be set when other
+            processes on the same host load the same checkpoint concurrently.
         """
         self.asset_store = asset_store
         self.download_manager = download_manager
@@ -188,6 +209,7 @@ class ModelLoader(Generic[ModelT, ConfigT]):
         self.model_factory = model_factory
         self.checkpoint_converter = checkpoint_converter
         self.restrict_checkpoints = restrict_checkpoints
+        self.drop_checkpoint_cache = drop_checkpoint_cache
 
     def __call__(
         self,
@@ -271,11 +293,6 @@ class ModelLoader(Generic[ModelT, ConfigT]):
 
         model_device = infer_device(model)
 
-        if model_device == META:
-            # Move the model to the actual device without initializing. Its
-            # state will be overwritten by the checkpoint anyways.
-            to_empty(model, device=device or CPU)
-
         # Load the model.
         try:
             state_dict = checkpoint["model"]
@@ -284,21 +301,136 @@ class ModelLoader(Generic[ModelT, ConfigT]):
                 f"The checkpoint of {card.name} does not contain a 'model' entry."
             )
 
-        try:
-            model.load_state_dict(state_dict)
-        except (KeyError, ValueError) as ex:
-            raise AssetError(
-                f"{card.name} cannot be loaded. See nested exception for details."
-            ) from ex
+        tied_param_names = _get_tied_parameter_names(model)
+
+        if model_device == META and _is_pt21_or_greater():
+            # Instead of materializing the model and copying the checkpoint into
+            # it, directly assign the (memory-mapped) checkpoint tensors to the
+            # model. This avoids holding two copies of the model in memory.
+            try:
+                _assign_state_dict(model, state_dict, tied_param_names, device or CPU)
+            except (KeyError, ValueError, RuntimeError) as ex:
+                raise AssetError(
+                    f"{card.name} cannot be loaded. See nested exception for details."
+                ) from ex
+        else:
+            if model_device == META:
+                # Move the model to the actual device without initializing. Its
+                # state will be overwritten by the checkpoint anyways.
+                to_empty(model, device=device or CPU)
+
+            try:
+                model.load_state_dict(state_dict)
+            except (KeyError, ValueError, RuntimeError) as ex:
+                raise AssetError(
+                    f"{card.name} cannot be loaded. See nested exception for details."
+                ) from ex
 
         if model_device == META:
             # Non-persistent buffers are not included in the checkpoint, so we
             # have to explicitly initialize them.
             reset_non_persistent_buffers(model)
 
+        del checkpoint, state_dict
+
+        # If requested, do not let the checkpoint evict the working set of the
+        # process (e.g. dataset shards) from the page cache. Note that the
+        # kernel keeps the pages that are still memory-mapped by the model.
+        if self.drop_checkpoint_cache and hasattr(os, "posix_fadvise"):
+            _posix_fadvise(path, os.POSIX_FADV_DONTNEED)
+
         return model
 
 
+def _get_tied_parameter_names(model: Module) -> List[List[str]]:
+    """Return the groups of parameter names of ``model`` that refer to the same
+    parameter."""
+    param_names: Dict[int, List[str]] = {}
+
+    for name, param in model.named_parameters(remove_duplicate=False):
+        param_names.setdefault(id(param), []).append(name)
+
+    return [names for names in param_names.values() if len(names) > 1]
+
+
+def _assign_state_dict(
+    model: Module,
+    state_dict: Dict[str, Any],
+    tied_param_names: List[List[str]],
+    device: Device,
+) -> None:
+    """Load ``state_dict`` into ``model`` residing on the meta device by assigning
+    its tensors to the parameters and buffers of ``model``."""
+    model_state_dict = model.state_dict()
+
+    memo: Dict[Tuple[Any, ...], Tensor] = {}
+
+    # Match the device and data type of the checkpoint tensors with the model.
+    # If they already match, no copy is made.
+    for key, tensor in state_dict.items():
+        if not isinstance(tensor, Tensor):
+            continue
+
+        try:
+            dtype = model_state_dict[key].dtype
+        except KeyError:
+            continue
+
+        # Tied parameters saved via `state_dict()` are unpickled as distinct
+        # tensors sharing a storage; make sure that we convert them only once.
+        view_key = (
+            tensor.untyped_storage().data_ptr(),
+            tensor.storage_offset(),
+            tensor.shape,
+            tensor.stride(),
+            tensor.dtype,
+        )
+
+        try:
+            state_dict[key] = memo[view_key]
+        except KeyError:
+            state_dict[key] = memo[view_key] = tensor.to(device, dtype)
+
+    del memo
+
+    model.load_state_dict(state_dict, assign=True)
+
+    # `load_state_dict(assign=True)` creates a new `Parameter` for each entry
+    # which breaks weight tying; restore it.
+    for names in tied_param_names:
+        param = model.get_parameter(names[0])
+
+        for name in names[1:]:
+            module_name, _, param_name = name.rpartition(".")
+
+            setattr(model.get_submodule(module_name), param_name, param)
+
+    # Non-persistent buffers are not part of the checkpoint; move them to the
+    # actual device so that they can be initialized.
+    for m in model.modules():
+        for buffer_name, buffer in m.named_buffers(recurse=False):
+            if buffer is not None and buffer.device == META:
+                setattr(m, buffer_name, torch.empty_like(buffer, device=device))
+
+
+def _posix_fadvise(path: Path, advice: int) -> None:
+    """Announce to the kernel the intended access pattern of the file at ``path``.
+
+    This is a best-effort hint; errors are ignored.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 TokenizerT = TypeVar("TokenizerT", bound=TextTokenizer)
 TokenizerT_co = TypeVar("TokenizerT_co", bound=TextTokenizer, covariant=True)
 
@@ -355,6 +487,11 @@ class TokenizerLoaderBase(ABC, Generic[TokenizerT]):
                 f"The value of the field 'tokenizer' of the asset card '{card.name}' is not valid. See nested exception for details."
             ) from ex
 
+        # Let the kernel start reading the tokenizer file into the page cache
+        # asynchronously while the subclass processes the asset card.
+        if hasattr(os, "posix_fadvise"):
+            _posix_fadvise(path, os.POSIX_FADV_WILLNEED)
+
         try:
             return self._load(path, card)
         except ValueError as ex:
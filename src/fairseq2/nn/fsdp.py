@@ -7,7 +7,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Final, Iterable, Optional, Protocol, Sequence
+from typing import Dict, Final, List, Optional, Protocol, Sequence
 
 from torch import Tensor
 from torch.distributed.fsdp import FullyShardedDataParallel as FSDP
@@ -79,6 +79,11 @@ def to_fsdp(
     else:
         param_init_fn = None
 
+    if ignored_param_names:
+        ignored_params = get_ignored_parameters(module, ignored_param_names)
+    else:
+        ignored_params = None
+
     fsdp = FSDP(
         module,
         process_group=gang.as_process_group(),
@@ -92,7 +97,7 @@ def to_fsdp(
         forward_prefetch=static_graph and memory_policy.forward_prefetch,
         limit_all_gathers=memory_policy.limit_all_gathers,
         use_orig_params=True,
-        ignored_states=get_ignored_parameters(module, ignored_param_names),
+        ignored_states=ignored_params,
     )
 
     FSDP.set_state_dict_type(
@@ -179,7 +184,7 @@ computation overlap, offloads parameters to CPU."""
 
 def get_ignored_parameters(
     module: Module, names: Optional[Sequence[str]]
-) -> Optional[Iterable[Parameter]]:
+) -> Optional[List[Parameter]]:
     """Get the list of parameters that should be ignored by FSDP.
 
     :param module:
@@ -187,10 +192,12 @@ def get_ignored_parameters(
     :param names:
         The ignored parameter names, can contain regular expressions.
     """
-    if names is None:
+    if not names:
         return None
 
-    return (p for _, p in select_parameters(module, names))
+    # Materialize the selection so that callers can iterate over it more than
+    # once without walking the module again.
+    return [p for _, p in select_parameters(module, names)]
 
 
 class FSDPParameterInitializer:
@@ -76,15 +76,11 @@ def to_padding_mask(seq_lens: Tensor, batch_seq_len: int) -> Tensor:
         The mask. *Shape:* :math:`(N,S)`, where :math:`N` is the batch size and
         :math:`S` is the sequence length.
     """
-    batch_size = seq_lens.size(0)
+    # (S)
+    indices = torch.arange(batch_seq_len, device=seq_lens.device)
 
-    # (N, S)
-    indices = torch.arange(batch_seq_len, device=seq_lens.device).expand(batch_size, -1)
-
-    # (N) -> (N, S)
-    lengths = seq_lens.unsqueeze(1).expand(-1, batch_seq_len)
-
-    return indices < lengths
+    # (S) < (N, 1) -> (N, S)
+    return indices < seq_lens.unsqueeze(1)
 
 
 def apply_padding_mask(
@@ -89,8 +89,14 @@ def select_parameters(
     :returns:
         An iterable of name-parameter tuples.
     """
+    exact_names = set(names)
+
+    # Compile the patterns once instead of looking them up in the regex cache
+    # for every parameter.
+    patterns = [re.compile(n) for n in names]
+
     for name, param in module.named_parameters():
-        matched = any(name == pattern or re.match(pattern, name) for pattern in names)
+        matched = name in exact_names or any(p.match(name) for p in patterns)
 
         if (matched and not exclude) or (not matched and exclude):
             yield name, param
@@ -0,0 +1,225 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+import re
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib import import_module
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any, Generator, List, Optional
+
+import pytest
+from pytest import MonkeyPatch
+
+from fairseq2.assets import AssetDownloadError, InProcAssetDownloadManager
+
+# Note that `fairseq2.assets.download_manager` as an attribute refers to the
+# default download manager instance, not to the module.
+download_manager_module = import_module("fairseq2.assets.download_manager")
+
+_CONTENT = os.urandom(10_000)
+
+
+class _AssetServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    accept_ranges: bool
+    honor_ranges: bool
+    short_range_begin: Optional[int]
+    trickle_ranges: bool
+    range_started: Event
+    statuses: List[int]
+    statuses_lock: Lock
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _AssetRequestHandler)
+
+        self.accept_ranges = False
+        self.honor_ranges = True
+        self.short_range_begin = None
+        self.trickle_ranges = False
+        self.range_started = Event()
+
+        self.statuses = []
+        self.statuses_lock = Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/checkpoint.pt"
+
+
+class _AssetRequestHandler(BaseHTTPRequestHandler):
+    server: _AssetServer
+
+    def do_GET(self) -> None:
+        server = self.server
+
+        begin, end = 0, len(_CONTENT)
+
+        status = 200
+
+        range_header = self.headers.get("Range")
+        if range_header is not None and server.accept_ranges and server.honor_ranges:
+            match = re.fullmatch(r"bytes=([0-9]+)-([0-9]+)", range_header)
+
+            assert match is not None
+
+            begin, end = int(match[1]), int(match[2]) + 1
+
+            status = 206
+
+        content = _CONTENT[begin:end]
+
+        # Simulate a server that sends less data than requested for a part.
+        if status == 206 and begin == server.short_range_begin:
+            content = content[: len(content) // 2]
+
+        with server.statuses_lock:
+            server.statuses.append(status)
+
+        self.send_response(status)
+
+        self.send_header("Content-Length", str(len(content)))
+
+        if server.accept_ranges:
+            self.send_header("Accept-Ranges", "bytes")
+
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {begin}-{end - 1}/{len(_CONTENT)}")  # fmt: skip
+
+        self.end_headers()
+
+        if status == 206 and server.trickle_ranges:
+            # Simulate a slow server that takes several seconds per part.
+            try:
+                for offset in range(0, len(content), 16):
+                    self.wfile.write(content[offset : offset + 16])
+
+                    self.wfile.flush()
+
+                    server.range_started.set()
+
+                    time.sleep(0.05)
+            except OSError:  # The client has closed the connection.
+                pass
+        else:
+            self.wfile.write(content)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+class TestInProcAssetDownloadManager:
+    @pytest.fixture(autouse=True)
+    def setup(
+        self, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> Generator[None, None, None]:
+        # Split our small test asset into multiple parts.
+        monkeypatch.setattr(download_manager_module, "_MIN_PART_SIZE", 1024)
+        monkeypatch.setattr(download_manager_module, "_RANGE_BUFFER_SIZE", 512)
+
+        self.server = _AssetServer()
+
+        thread = Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+        thread.start()
+
+        self.download_manager = InProcAssetDownloadManager()
+
+        self.download_manager.cache_dir = tmp_path
+
+        self.download_manager.num_streams = 4
+
+        yield
+
+        self.server.shutdown()
+
+        self.server.server_close()
+
+        thread.join()
+
+    def download(self) -> Path:
+        return self.download_manager.download_checkpoint(
+            self.server.url, "foo_model", progress=False
+        )
+
+    def test_download_checkpoint_works_when_server_supports_ranges(self) -> None:
+        self.server.accept_ranges = True
+
+        path = self.download()
+
+        assert path.read_bytes() == _CONTENT
+
+        # The initial request followed by one range request per part.
+        assert sorted(self.server.statuses) == [200, 206, 206, 206, 206]
+
+    def test_download_checkpoint_works_when_server_does_not_support_ranges(
+        self,
+    ) -> None:
+        path = self.download()
+
+        assert path.read_bytes() == _CONTENT
+
+        assert self.server.statuses == [200]
+
+    def test_download_checkpoint_raises_error_when_server_ignores_ranges(
+        self,
+    ) -> None:
+        self.server.accept_ranges = True
+        self.server.honor_ranges = False
+
+        with pytest.raises(
+            AssetDownloadError, match=r"The server does not honor range requests\.$"
+        ):
+            self.download()
+
+    def test_download_checkpoint_raises_error_when_range_is_short(self) -> None:
+        self.server.accept_ranges = True
+        self.server.short_range_begin = 2500
+
+        with pytest.raises(
+            AssetDownloadError,
+            match=r"which is less than the expected size of 2,500 bytes for the range starting at byte 2,500\.$",
+        ):
+            self.download()
+
+        # The partially downloaded asset must not end up in the cache.
+        self.server.short_range_begin = None
+
+        path = self.download()
+
+        assert path.read_bytes() == _CONTENT
+
+    def test_download_checkpoint_stops_parts_when_interrupted(
+        self, monkeypatch: MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(download_manager_module, "_RANGE_BUFFER_SIZE", 16)
+
+        self.server.accept_ranges = True
+        self.server.trickle_ranges = True
+
+        def interrupt(future: Future[Any], timeout: Optional[float] = None) -> Any:
+            # Abort the main thread while the parts are still in flight.
+            self.server.range_started.wait(timeout=10.0)
+
+            raise KeyboardInterrupt()
+
+        monkeypatch.setattr(Future, "result", interrupt)
+
+        start_time = time.monotonic()
+
+        with pytest.raises(KeyboardInterrupt):
+            self.download()
+
+        # Downloading the parts in full would take around eight seconds.
+        assert time.monotonic() - start_time < 2.0
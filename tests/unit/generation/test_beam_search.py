@@ -0,0 +1,129 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from typing import List
+
+import torch
+from pytest import MonkeyPatch
+from torch import Tensor
+
+from fairseq2.data import VocabularyInfo
+from fairseq2.generation import BeamSearchSeq2SeqGenerator, Hypothesis
+from fairseq2.generation.beam_search import (
+    _BeamSearchSeq2SeqGeneratorOp,
+    _BeamSearchSequenceGeneratorOpBase,
+)
+from fairseq2.models.encoder_decoder import EncoderDecoderModel
+from fairseq2.models.nllb import NllbConfig, create_nllb_model
+from fairseq2.nn.padding import PaddingMask
+from tests.common import assert_close, assert_equal, device, tmp_rng_seed
+
+
+def _always_reorder_state(
+    self: _BeamSearchSeq2SeqGeneratorOp, new_order: Tensor
+) -> None:
+    _BeamSearchSequenceGeneratorOpBase._reorder_state(self, new_order)
+
+    self.encoder_output = self.encoder_output.index_select(dim=0, index=new_order)
+
+    if self.encoder_padding_mask is not None:
+        encoder_seq_lens = self.encoder_padding_mask.seq_lens
+
+        encoder_seq_lens = encoder_seq_lens.index_select(dim=0, index=new_order)
+
+        self.encoder_padding_mask = PaddingMask(
+            encoder_seq_lens, batch_seq_len=self.encoder_output.size(1)
+        )
+
+
+class TestBeamSearchSeq2SeqGenerator:
+    def test_call_works_when_beams_finish_at_different_steps(
+        self, monkeypatch: MonkeyPatch
+    ) -> None:
+        model = self.build_model()
+
+        source_seqs = torch.tensor(
+            [[4, 5, 6, 7, 8, 9, 1], [10, 11, 12, 0, 0, 0, 0], [5, 7, 9, 11, 13, 0, 0]],
+            device=device,
+        )
+        source_padding_mask = PaddingMask(
+            torch.tensor([7, 3, 5], device=device), batch_seq_len=7
+        )
+
+        # Mixed prompt lengths.
+        prompt_seqs = torch.tensor(
+            [[3, 10, 11, 0], [3, 0, 0, 0], [3, 13, 14, 15]], device=device
+        )
+        prompt_padding_mask = PaddingMask(
+            torch.tensor([3, 1, 4], device=device), batch_seq_len=4
+        )
+
+        generator = BeamSearchSeq2SeqGenerator(model, beam_size=3, max_gen_len=(0, 12))
+
+        def generate() -> List[List[Hypothesis]]:
+            output = generator(
+                source_seqs, source_padding_mask, prompt_seqs, prompt_padding_mask
+            )
+
+            return output.hypotheses
+
+        hypotheses = generate()
+
+        # Make sure that the test actually covers beams that finish at different
+        # steps; otherwise, the encoder output would never get reordered.
+        seq_lens = {len(hyp.seq) for hyps in hypotheses for hyp in hyps}
+
+        assert len(seq_lens) > 1
+
+        monkeypatch.setattr(
+            _BeamSearchSeq2SeqGeneratorOp, "_reorder_state", _always_reorder_state
+        )
+
+        expected_hypotheses = generate()
+
+        assert len(hypotheses) == len(expected_hypotheses)
+
+        for hyps, expected_hyps in zip(hypotheses, expected_hypotheses):
+            assert len(hyps) == len(expected_hyps)
+
+            for hyp, expected_hyp in zip(hyps, expected_hyps):
+                assert_equal(hyp.seq, expected_hyp.seq)
+
+                assert hyp.score is not None
+                assert hyp.step_scores is not None
+
+                assert expected_hyp.score is not None
+                assert expected_hyp.step_scores is not None
+
+                assert_close(hyp.score, expected_hyp.score)
+                assert_close(hyp.step_scores, expected_hyp.step_scores)
+
+    @staticmethod
+    def build_model() -> EncoderDecoderModel:
+        vocab_info = VocabularyInfo(size=20, unk_idx=1, bos_idx=2, eos_idx=3, pad_idx=0)
+
+        config = NllbConfig(
+            model_dim=32,
+            max_seq_len=64,
+            vocab_info=vocab_info,
+            num_encoder_layers=2,
+            num_decoder_layers=2,
+            num_encoder_attn_heads=4,
+            num_decoder_attn_heads=4,
+            ffn_inner_dim=64,
+            dropout_p=0.0,
+        )
+
+        with tmp_rng_seed(device):
+            model = create_nllb_model(config, device=device)
+
+            # Use large weights so that the model is opinionated enough to have
+            # some of its beams finish early.
+            with torch.no_grad():
+                for param in model.parameters():
+                    param.normal_(0.0, 0.5)
+
+        return model.eval()
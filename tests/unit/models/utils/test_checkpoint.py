@@ -0,0 +1,32 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+from fairseq2.models.utils.checkpoint import convert_model_state_dict
+
+
+def test_convert_model_state_dict_works() -> None:
+    state_dict = {
+        "encoder.layers.0.fc1.weight": 1,
+        "encoder.layers.1.fc1.weight": 2,
+        "Decoder.Output_Projection.weight": 3,
+        "encoder.layer_norm.weight": 4,
+    }
+
+    key_map = {
+        # fmt: off
+        r"^encoder\.layers\.([0-9]+)\.fc1\.": r"encoder.layers.\1.ffn.inner_proj.",
+        r"(?i)^decoder\.output_projection\.": r"final_proj.",
+        # fmt: on
+    }
+
+    new_state_dict = convert_model_state_dict(state_dict, key_map)
+
+    assert new_state_dict == {
+        "encoder.layers.0.ffn.inner_proj.weight": 1,
+        "encoder.layers.1.ffn.inner_proj.weight": 2,
+        "final_proj.weight": 3,
+        "encoder.layer_norm.weight": 4,
+    }
@@ -0,0 +1,243 @@
+# Copyright (c) Meta Platforms, Inc. and affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the BSD-style license found in the
+# LICENSE file in the root directory of this source tree.
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytest
+import torch
+from pytest import MonkeyPatch
+from torch import Tensor
+from torch.nn import Embedding, Linear, Module
+
+from fairseq2.assets import (
+    AssetError,
+    InProcAssetDownloadManager,
+    InProcAssetMetadataProvider,
+    ProviderBackedAssetStore,
+)
+from fairseq2.models.utils import ConfigLoader, ModelLoader
+from fairseq2.models.utils.arch_registry import ArchitectureRegistry
+from fairseq2.typing import CPU, META, DataType, Device
+from fairseq2.utils.version import _is_pt21_or_greater
+from tests.common import assert_equal
+
+
+@dataclass
+class FooConfig:
+    num_embeddings: int
+    embedding_dim: int
+
+
+class FooModel(Module):
+    embed: Embedding
+    final_proj: Linear
+    steps: Tensor
+
+    def __init__(
+        self,
+        config: FooConfig,
+        *,
+        device: Optional[Device] = None,
+        dtype: Optional[DataType] = None,
+    ) -> None:
+        super().__init__()
+
+        self.embed = Embedding(
+            config.num_embeddings, config.embedding_dim, device=device, dtype=dtype
+        )
+
+        self.final_proj = Linear(
+            config.embedding_dim,
+            config.num_embeddings,
+            bias=False,
+            device=device,
+            dtype=dtype,
+        )
+
+        # Tie the weights.
+        self.final_proj.weight = self.embed.weight
+
+        steps = torch.empty((config.embedding_dim,), device=device, dtype=dtype)
+
+        self.register_buffer("steps", steps, persistent=False)
+
+        self.reset_non_persistent_buffers()
+
+    def reset_non_persistent_buffers(self) -> None:
+        self.steps.fill_(3.0)
+
+
+foo_archs = ArchitectureRegistry[FooConfig]("foo")
+
+foo_archs.register("base", lambda: FooConfig(num_embeddings=8, embedding_dim=4))
+
+
+class TestModelLoader:
+    @pytest.fixture(autouse=True, params=[True, False], ids=["assign", "copy"])
+    def setup(
+        self, request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: MonkeyPatch
+    ) -> None:
+        self.assign = request.param
+
+        if self.assign:
+            if not _is_pt21_or_greater():
+                pytest.skip("`load_state_dict(assign=True)` requires PyTorch 2.1.")
+        else:
+            # Exercise the fallback path of the older PyTorch versions.
+            monkeypatch.setattr(
+                "fairseq2.models.utils.generic_loaders._is_pt21_or_greater",
+                lambda: False,
+            )
+
+        self.checkpoint_path = tmp_path.joinpath("checkpoint.pt")
+
+        metadata = {
+            "name": "foo_model",
+            "model_type": "foo",
+            "model_arch": "base",
+            "checkpoint": str(self.checkpoint_path),
+        }
+
+        self.asset_store = ProviderBackedAssetStore(
+            InProcAssetMetadataProvider([metadata])
+        )
+
+        self.download_manager = InProcAssetDownloadManager()
+
+        self.config_loader = ConfigLoader[FooConfig](self.asset_store, foo_archs)
+
+        self.loader = self.build_loader()
+
+    def build_loader(
+        self, drop_checkpoint_cache: bool = False
+    ) -> ModelLoader[FooModel, FooConfig]:
+        return ModelLoader[FooModel, FooConfig](
+            self.asset_store,
+            self.download_manager,
+            self.config_loader,
+            FooModel,
+            drop_checkpoint_cache=drop_checkpoint_cache,
+        )
+
+    def save_checkpoint(self, state_dict: Dict[str, Tensor]) -> None:
+        torch.save({"model": state_dict}, self.checkpoint_path)
+
+    def test_call_works(self) -> None:
+        weight = torch.randn((8, 4), dtype=torch.float32)
+
+        self.save_checkpoint({"embed.weight": weight, "final_proj.weight": weight})
+
+        model = self.loader("foo_model", progress=False)
+
+        assert model.final_proj.weight.data_ptr() == model.embed.weight.data_ptr()
+
+        assert_equal(model.embed.weight, weight)
+
+        assert model.embed.weight.device == CPU
+
+        # The non-persistent buffer should be initialized.
+        assert_equal(model.steps, torch.full((4,), 3.0))
+
+    def test_call_works_when_checkpoint_has_different_dtype(self) -> None:
+        weight = torch.randn((8, 4), dtype=torch.float32)
+
+        self.save_checkpoint({"embed.weight": weight, "final_proj.weight": weight})
+
+        model = self.loader("foo_model", dtype=torch.float16, progress=False)
+
+        assert model.final_proj.weight.data_ptr() == model.embed.weight.data_ptr()
+
+        assert model.embed.weight.dtype == torch.float16
+
+        assert_equal(model.embed.weight, weight.half())
+
+        assert model.steps.dtype == torch.float16
+
+    def test_call_works_when_tied_tensors_are_distinct(self) -> None:
+        weight = torch.randn((8, 4), dtype=torch.float32)
+
+        # Mimic a checkpoint saved via `state_dict()` of a tied model; the
+        # tensors are distinct objects sharing the same storage.
+        self.save_checkpoint({"embed.weight": weight, "final_proj.weight": weight[:]})
+
+        num_converted_weights = 0
+
+        original_to = Tensor.to
+
+        def to(tensor: Tensor, *args: Any, **kwargs: Any) -> Tensor:
+            nonlocal num_converted_weights
+
+            output = original_to(tensor, *args, **kwargs)
+
+            # Ignore the conversions made while initializing the meta model.
+            if tensor.device != META and output.dtype != tensor.dtype:
+                num_converted_weights += 1
+
+            return output
+
+        with MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(Tensor, "to", to)
+
+            model = self.loader("foo_model", dtype=torch.float16, progress=False)
+
+        assert model.final_proj.weight.data_ptr() == model.embed.weight.data_ptr()
+
+        assert_equal(model.embed.weight, weight.half())
+
+        if self.assign:
+            # The shared storage should be converted only once.
+            assert num_converted_weights == 1
+
+    def test_call_raises_error_when_checkpoint_has_missing_key(self) -> None:
+        self.save_checkpoint({})
+
+        with pytest.raises(
+            AssetError, match=r"^foo_model cannot be loaded\. See nested exception"
+        ):
+            self.loader("foo_model", progress=False)
+
+    def test_call_raises_error_when_checkpoint_has_unexpected_key(self) -> None:
+        weight = torch.randn((8, 4), dtype=torch.float32)
+
+        self.save_checkpoint({"embed.weight": weight, "foo.weight": weight})
+
+        with pytest.raises(
+            AssetError, match=r"^foo_model cannot be loaded\. See nested exception"
+        ):
+            self.loader("foo_model", progress=False)
+
+    @pytest.mark.skipif(
+        not hasattr(os, "posix_fadvise"), reason="requires `os.posix_fadvise`."
+    )
+    @pytest.mark.parametrize("drop_checkpoint_cache", [True, False])
+    def test_call_drops_checkpoint_cache_when_requested(
+        self, drop_checkpoint_cache: bool, monkeypatch: MonkeyPatch
+    ) -> None:
+        weight = torch.randn((8, 4), dtype=torch.float32)
+
+        self.save_checkpoint({"embed.weight": weight, "final_proj.weight": weight})
+
+        # Holds the inode and the advice of each call.
+        calls: List[Tuple[int, int]] = []
+
+        def posix_fadvise(fd: int, offset: int, length: int, advice: int) -> None:
+            calls.append((os.fstat(fd).st_ino, advice))
+
+        monkeypatch.setattr(os, "posix_fadvise", posix_fadvise)
+
+        loader = self.build_loader(drop_checkpoint_cache=drop_checkpoint_cache)
+
+        loader("foo_model", progress=False)
+
+        if drop_checkpoint_cache:
+            checkpoint_ino = self.checkpoint_path.stat().st_ino
+
+            assert calls == [(checkpoint_ino, os.POSIX_FADV_DONTNEED)]
+        else:
+            assert calls == []
@@ -45,3 +45,22 @@ def test_select_parameters_when_exclude_is_true() -> None:
     num_params = len(list(model.parameters())) - config.num_decoder_layers - 1
 
     assert idx == num_params - 1
+
+
+def test_select_parameters_when_names_have_inline_flags() -> None:
+    config = nllb_archs.get_config("dense_1b")
+
+    model = create_nllb_model(config, device=Device("meta"))
+
+    output = select_parameters(
+        model, [r"(?i)DECODER\.LAYER_NORM\.", r"^encoder\.layer_norm\."]
+    )
+
+    names = [name for name, _ in output]
+
+    assert names == [
+        "encoder.layer_norm.weight",
+        "encoder.layer_norm.bias",
+        "decoder.layer_norm.weight",
+        "decoder.layer_norm.bias",
+    ]